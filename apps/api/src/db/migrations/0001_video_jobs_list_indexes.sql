@@ -0,0 +1,3 @@
+DROP INDEX IF EXISTS "video_jobs_user_id_idx";--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "video_jobs_user_created_idx" ON "video_jobs" USING btree ("user_id","created_at");--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "video_jobs_user_status_created_idx" ON "video_jobs" USING btree ("user_id","status","created_at");
@@ -107,8 +107,15 @@ export const videoJobs = pgTable(
   (table) => {
     return {
       videoIdIdx: index('video_jobs_video_id_idx').on(table.videoId),
-      userIdIdx: index('video_jobs_user_id_idx').on(table.userId),
+      // Back jobs.list (newest first, with and without a status filter). Kept ascending so a
+      // backward scan matches ORDER BY created_at DESC (NULLS FIRST) without a sort.
+      userCreatedIdx: index('video_jobs_user_created_idx').on(table.userId, table.createdAt),
       statusIdx: index('video_jobs_status_idx').on(table.status),
+      userStatusCreatedIdx: index('video_jobs_user_status_created_idx').on(
+        table.userId,
+        table.status,
+        table.createdAt
+      ),
     }
   }
 )
@@ -0,0 +1,44 @@
+import { describe, it, expect } from 'bun:test'
+import { IndexedColumn, getTableConfig } from 'drizzle-orm/pg-core'
+import { videoJobs } from '../../src/db/schema'
+
+// jobs.list orders by created_at DESC (NULLS FIRST); an ascending NULLS LAST
+// index is its exact reverse, so Postgres can walk it backwards without sorting
+const ascending = (name: string) => ({ name, order: 'asc', nulls: 'last' })
+
+function indexColumns(name: string) {
+  const index = getTableConfig(videoJobs).indexes.find((idx) => idx.config.name === name)
+  expect(index).toBeDefined()
+
+  return index!.config.columns.map((column) => {
+    expect(column).toBeInstanceOf(IndexedColumn)
+    const indexed = column as IndexedColumn
+    return {
+      name: indexed.name,
+      order: indexed.indexConfig.order,
+      nulls: indexed.indexConfig.nulls,
+    }
+  })
+}
+
+describe('Database Schema', () => {
+  it('should index video jobs for the unfiltered jobs list query', () => {
+    expect(indexColumns('video_jobs_user_created_idx')).toEqual([
+      ascending('user_id'),
+      ascending('created_at'),
+    ])
+  })
+
+  it('should index video jobs for the status-filtered jobs list query', () => {
+    expect(indexColumns('video_jobs_user_status_created_idx')).toEqual([
+      ascending('user_id'),
+      ascending('status'),
+      ascending('created_at'),
+    ])
+  })
+
+  it('should not keep a redundant user_id-only index on video jobs', () => {
+    const indexNames = getTableConfig(videoJobs).indexes.map((idx) => idx.config.name)
+    expect(indexNames).not.toContain('video_jobs_user_id_idx')
+  })
+})